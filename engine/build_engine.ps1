@@ -85,12 +85,23 @@ $requiredDlls = @(
     "wavpackdll.dll"
 )
 
-# Copy all DLLs from vcpkg
+# List both folders once and look DLLs up by name instead of stat-ing each path
+$vcpkgDlls = @{}
+Get-ChildItem $vcpkgBinDir -Filter *.dll -File -ErrorAction SilentlyContinue | ForEach-Object { $vcpkgDlls[$_.Name] = $_ }
+$runtimeDlls = @{}
+Get-ChildItem $runtimeDir -Filter *.dll -File -ErrorAction SilentlyContinue | ForEach-Object { $runtimeDlls[$_.Name] = $_ }
+
+# Copy all DLLs from vcpkg (skip ones already up to date in the runtime folder)
 foreach ($dll in $requiredDlls) {
-    $srcPath = Join-Path $vcpkgBinDir $dll
-    if (Test-Path $srcPath) {
-        Copy-Item $srcPath $runtimeDir -Force
-        Write-Host "  Copied $dll" -ForegroundColor Green
+    $src = $vcpkgDlls[$dll]
+    if ($src) {
+        $dst = $runtimeDlls[$dll]
+        if ($dst -and $dst.Length -eq $src.Length -and $dst.LastWriteTimeUtc -eq $src.LastWriteTimeUtc) {
+            Write-Host "  $dll up to date" -ForegroundColor Gray
+        } else {
+            Copy-Item $src.FullName $runtimeDir -Force
+            Write-Host "  Copied $dll" -ForegroundColor Green
+        }
     } else {
         Write-Host "  Warning: $dll not found" -ForegroundColor Yellow
     }
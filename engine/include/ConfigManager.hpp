@@ -33,7 +33,7 @@ public:
     ConfigManager();
     ~ConfigManager();
 
-    // Load and save settings
+    // Load and save settings (saving is skipped when nothing changed since the last load/save)
     bool LoadEngineSettings(const std::string& configPath = "config.ini");
     void SaveEngineSettings(const std::string& configPath = "config.ini");
 
@@ -71,8 +71,10 @@ public:
 private:
     DisplaySettings displaySettings;
     AudioSettings audioSettings;
+    bool settingsDirty;  // Set when a saved setting changes, cleared on load/save
 
     void CalculateRenderScale();
+    void StepResolution(int delta);
 };
 
 } // namespace Lehran
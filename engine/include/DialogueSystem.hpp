@@ -40,6 +40,12 @@ private:
     size_t revealedChars;
     bool instantText; // If true, show all text immediately
     
+    // Textures for the current line, resolved once when the line changes
+    SDL_Texture* lineSpriteLeft;
+    SDL_Texture* lineSpriteRight;
+    SDL_Texture* linePortrait;
+    std::vector<std::string> lineWrappedText;
+    
     // For choices
     std::vector<Choice> currentChoices;
     int selectedChoice;
@@ -49,9 +55,11 @@ private:
     static const int DIALOGUE_BOX_HEIGHT = 270;
     static const int DIALOGUE_BOX_Y = 810;
     static const int PORTRAIT_SIZE = 216;
+    static const int TEXT_MAX_WIDTH = 1400;
     
     void RenderText(const std::string& text, int x, int y, TTF_Font* font, SDL_Color color, bool centered = false);
     std::vector<std::string> WrapText(const std::string& text, TTF_Font* font, int maxWidth);
+    void PrepareCurrentLine();
     
 public:
     DialogueSystem(SDL_Renderer* renderer, TTF_Font* fontMedium, 
@@ -7,6 +7,7 @@
 #include "json.hpp"
 #include <string>
 #include <vector>
+#include <unordered_map>
 
 using json = nlohmann::json;
 
@@ -54,6 +55,7 @@ struct MapUnit {
     std::string type;        // "player" or "enemy"
     std::string unitId;      // ID to lookup in units.json
     std::string name;        // Unit name from data
+    std::string classId;     // Class ID to lookup in classes.json
     std::string className;   // Class name from data
     int level;               // Current level
     std::string spritePath;
@@ -87,6 +89,7 @@ private:
     std::string atlasPath;
     int tileSize;
     std::vector<TileType> tileTypes;
+    std::unordered_map<int, SDL_Texture*> tileTexturesById;  // Tile ID -> texture, built by LoadAtlas
     
     // Map data
     std::string mapName;
@@ -96,8 +99,10 @@ private:
     std::vector<MapLayer> layers;
     std::vector<MapUnit> units;
     
-    // Weapon and class data
-    json weaponsData;
+    // Unit, weapon and class data, loaded once by LoadUnitData
+    bool unitDataLoaded;
+    json unitsData;
+    std::unordered_map<std::string, WeaponData> weaponsById;  // Weapon ID -> data, built by BuildWeaponIndex
     json classesData;
     
     // Camera
@@ -117,6 +122,7 @@ private:
     // Unit selection and movement
     int selectedUnitIndex;   // Index of selected unit, -1 if none
     std::vector<std::pair<int, int>> moveRangeTiles;  // Tiles within move range
+    std::vector<bool> moveRangeGrid;  // Same tiles as moveRangeTiles, indexed by y * mapWidth + x
     std::vector<std::pair<int, int>> attackRangeTiles; // Tiles within attack range
     SDL_Texture* moveRangeTexture;
     SDL_Texture* attackRangeTexture;
@@ -139,11 +145,28 @@ private:
     bool showUnitInfo;
     int unitInfoIndex;  // Unit whose info is being shown
     
+    bool uiAssetsLoaded;  // Cursor/range textures and cursor sound, loaded on first LoadMap
+    
+    // Fixed menu labels, rendered the first time their menu is shown
+    struct MenuLabel {
+        SDL_Texture* texture = nullptr;
+        int width = 0;
+        int height = 0;
+    };
+    MenuLabel itemsLabel;
+    MenuLabel waitLabel;
+    MenuLabel dropLabel;
+    
     void ClearAtlas();
     void ClearMap();
+    void LoadUIAssets();
+    void RenderMenuLabel(MenuLabel& label, const char* text, int x, int y);
+    void ClearMenuLabels();
+    void LoadUnitData();
     void CalculateMovementRange();
     void CalculateAttackRange();
     int GetUnitAtPosition(int x, int y) const;
+    void BuildWeaponIndex(const json& weaponsData);
     WeaponData GetWeaponData(const std::string& weaponId) const;
     bool CanUnitWieldWeapon(const MapUnit& unit, const WeaponData& weapon) const;
     std::string GetClassDisplayName(const std::string& classId) const;
@@ -3,6 +3,7 @@
 #include <SDL.h>
 #include <SDL_ttf.h>
 #include <string>
+#include <unordered_map>
 #include "json.hpp"
 #include "ConfigManager.hpp"
 
@@ -37,9 +38,19 @@ private:
     TTF_Font* fontLarge;
     TTF_Font* fontMedium;
     TTF_Font* fontSmall;
+    SDL_Texture* gradientTexture;  // Title/settings background, built on first use
+
+    // Rendered text, keyed by font + RGB + string; alpha is applied per draw
+    struct CachedText {
+        SDL_Texture* texture;
+        int width;
+        int height;
+    };
+    std::unordered_map<std::string, CachedText> textCache;
 
     // Helper methods
     void RenderGradientBackground();
+    void ClearTextCache();
 };
 
 } // namespace Lehran
@@ -11,6 +11,7 @@
 #include <map>
 #include <cstdint>
 #include <ctime>
+#include <filesystem>
 #include "json.hpp"
 
 using json = nlohmann::json;
@@ -142,6 +143,12 @@ public:
      */
     bool get_slot_info(int slot_number, std::string& slot_name, time_t& timestamp);
     
+    /**
+     * Get the last write time and size of a save slot's file (no parsing)
+     * @return false if the slot has no save file
+     */
+    bool get_slot_file_stamp(int slot_number, std::filesystem::file_time_type& write_time, std::uintmax_t& file_size) const;
+    
     /**
      * Delete a save slot
      */
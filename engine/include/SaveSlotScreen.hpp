@@ -5,6 +5,7 @@
 #include "SaveManager.hpp"
 #include <string>
 #include <vector>
+#include <filesystem>
 
 class SaveSlotScreen {
 public:
@@ -22,6 +23,12 @@ public:
         int chapter;
         std::string timestamp;
         int playtime; // in seconds
+        std::string chapterText;  // Preformatted for Render()
+        std::string playtimeText; // Preformatted for Render()
+        bool hasFile;  // Save file existed at last scan
+        std::filesystem::file_time_type writeTime; // Save file mtime at last scan
+        std::uintmax_t fileSize;  // Save file size at last scan
+        bool writeTimeRecent;  // mtime was too close to the scan to tell later writes apart
     };
     
 private:
@@ -30,10 +37,12 @@ private:
     TTF_Font* fontMedium;
     TTF_Font* fontSmall;
     Lehran::SaveManager* saveManager;
+    SDL_Texture* backgroundTexture; // Gradient background, built on first Render()
     
     Mode currentMode;
     int selectedSlot;
     std::vector<SlotInfo> slots;
+    bool slotInfoLoaded; // False until the first LoadSlotInfo() scan
     bool shouldReturn; // Return to title screen
     int selectedSlotToStart; // The slot chosen to begin/load
     
@@ -50,6 +59,7 @@ private:
 public:
     SaveSlotScreen(SDL_Renderer* renderer, TTF_Font* fontLarge, TTF_Font* fontMedium, 
                    TTF_Font* fontSmall, Lehran::SaveManager* saveManager);
+    ~SaveSlotScreen();
     
     void SetMode(Mode mode);
     void HandleInput(SDL_Keycode key);
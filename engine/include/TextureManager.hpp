@@ -10,6 +10,8 @@ class TextureManager {
 private:
     SDL_Renderer* renderer;
     std::unordered_map<std::string, SDL_Texture*> textureCache;
+    int maxTextureWidth;   // Renderer limits (0 = unknown)
+    int maxTextureHeight;
     
 public:
     explicit TextureManager(SDL_Renderer* renderer);
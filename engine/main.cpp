@@ -101,6 +101,14 @@ public:
             return false;
         }
         
+        // Load the music decoders up front so the first Mix_LoadMUS/Mix_LoadWAV
+        // (title music after the splash) doesn't stall while they're pulled in lazily
+        int mixFlags = MIX_INIT_OGG | MIX_INIT_MP3;
+        int mixInitialized = Mix_Init(mixFlags);
+        if ((mixInitialized & mixFlags) != mixFlags) {
+            std::cerr << "SDL_mixer decoder preload incomplete: " << Mix_GetError() << std::endl;
+        }
+        
         // Initialize SDL_mixer (graceful failure - audio is optional)
         if (Mix_OpenAudio(44100, MIX_DEFAULT_FORMAT, 2, 2048) < 0) {
             std::cerr << "SDL_mixer initialization failed: " << Mix_GetError() << std::endl;
@@ -525,7 +533,9 @@ public:
             
             // Load map music if specified
             std::string mapMusic = mapManager->GetMapMusic();
-            if (!mapMusic.empty()) {
+            if (!mapMusic.empty() && currentMusicPath == mapMusic && Mix_PlayingMusic()) {
+                std::cout << "Map music already playing, not restarting" << std::endl;
+            } else if (!mapMusic.empty()) {
                 if (bgm) {
                     Mix_FreeMusic(bgm);
                     bgm = nullptr;
@@ -611,12 +621,19 @@ public:
     void LoadSceneMusic(const std::string& musicFile) {
         if (!audioInitialized) return;
         
+        std::string musicPath = "assets/" + musicFile;
+        
+        // Consecutive scenes often share a track - keep it playing instead of re-decoding
+        if (currentMusicPath == musicPath && Mix_PlayingMusic()) {
+            std::cout << "Scene music already playing, not restarting" << std::endl;
+            return;
+        }
+        
         if (bgm) {
             Mix_FreeMusic(bgm);
             bgm = nullptr;
         }
         
-        std::string musicPath = "assets/" + musicFile;
         bgm = Mix_LoadMUS(musicPath.c_str());
         
         if (!bgm) {
@@ -792,6 +809,7 @@ public:
         if (audioInitialized) {
             Mix_CloseAudio();
         }
+        Mix_Quit();
         if (fontLarge) TTF_CloseFont(fontLarge);
         if (fontMedium) TTF_CloseFont(fontMedium);
         if (fontSmall) TTF_CloseFont(fontSmall);
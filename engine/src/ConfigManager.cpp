@@ -9,7 +9,12 @@ namespace Lehran {
 const int SCREEN_WIDTH = 1920;
 const int SCREEN_HEIGHT = 1080;
 
-ConfigManager::ConfigManager() {
+// Windowed resolutions, indexed by selectedResolutionIndex
+const int RESOLUTION_COUNT = 3;
+const int RESOLUTION_WIDTHS[RESOLUTION_COUNT] = {1280, 1600, 1920};
+const int RESOLUTION_HEIGHTS[RESOLUTION_COUNT] = {720, 900, 1080};
+
+ConfigManager::ConfigManager() : settingsDirty(true) {
     // Default settings
     displaySettings.windowWidth = 1280;
     displaySettings.windowHeight = 720;
@@ -33,6 +38,7 @@ bool ConfigManager::LoadEngineSettings(const std::string& configPath) {
         std::ifstream settingsFile(configPath);
         if (settingsFile.is_open()) {
             std::string line;
+            int keysFound = 0;
             while (std::getline(settingsFile, line)) {
                 // Skip empty lines and comments
                 if (line.empty() || line[0] == ';' || line[0] == '#') continue;
@@ -67,7 +73,12 @@ bool ConfigManager::LoadEngineSettings(const std::string& configPath) {
                         audioSettings.sfxVolume = std::stoi(value);
                     } else if (key == "voice_volume") {
                         audioSettings.voiceVolume = std::stoi(value);
+                    } else if (key == "vsync") {
+                        // Written for reference only; not read back yet
+                    } else {
+                        continue;
                     }
+                    keysFound++;
                 }
             }
             settingsFile.close();
@@ -76,16 +87,19 @@ bool ConfigManager::LoadEngineSettings(const std::string& configPath) {
             CalculateRenderScale();
 
             // Set resolution index based on loaded dimensions
-            if (displaySettings.windowWidth == 1280 && displaySettings.windowHeight == 720) {
-                displaySettings.selectedResolutionIndex = 0;
-            } else if (displaySettings.windowWidth == 1600 && displaySettings.windowHeight == 900) {
-                displaySettings.selectedResolutionIndex = 1;
-            } else if (displaySettings.windowWidth == 1920 && displaySettings.windowHeight == 1080) {
-                displaySettings.selectedResolutionIndex = 2;
-            } else {
-                displaySettings.selectedResolutionIndex = 0; // Default to 720p if unknown
+            displaySettings.selectedResolutionIndex = 0; // Default to 720p if unknown
+            for (int i = 0; i < RESOLUTION_COUNT; i++) {
+                if (displaySettings.windowWidth == RESOLUTION_WIDTHS[i] &&
+                    displaySettings.windowHeight == RESOLUTION_HEIGHTS[i]) {
+                    displaySettings.selectedResolutionIndex = i;
+                    break;
+                }
             }
 
+            // SaveEngineSettings writes 8 keys; older config files missing some of
+            // them are rewritten in full on the next save
+            settingsDirty = keysFound < 8;
+
             std::cout << "Engine settings loaded successfully" << std::endl;
             std::cout << "  Resolution: " << displaySettings.windowWidth << "x" 
                       << displaySettings.windowHeight << std::endl;
@@ -104,6 +118,10 @@ bool ConfigManager::LoadEngineSettings(const std::string& configPath) {
 }
 
 void ConfigManager::SaveEngineSettings(const std::string& configPath) {
+    if (!settingsDirty) {
+        return;
+    }
+
     try {
         std::ofstream settingsFile(configPath);
         if (settingsFile.is_open()) {
@@ -120,6 +138,7 @@ void ConfigManager::SaveEngineSettings(const std::string& configPath) {
             settingsFile << "sfx_volume=" << audioSettings.sfxVolume << "\n";
             settingsFile << "voice_volume=" << audioSettings.voiceVolume << "\n";
             settingsFile.close();
+            settingsDirty = false;
             std::cout << "Engine settings saved" << std::endl;
         }
     } catch (const std::exception& e) {
@@ -128,12 +147,18 @@ void ConfigManager::SaveEngineSettings(const std::string& configPath) {
 }
 
 void ConfigManager::SetWindowSize(int width, int height) {
+    if (width != displaySettings.windowWidth || height != displaySettings.windowHeight) {
+        settingsDirty = true;
+    }
     displaySettings.windowWidth = width;
     displaySettings.windowHeight = height;
     CalculateRenderScale();
 }
 
 void ConfigManager::SetWindowMode(WindowMode mode) {
+    if (mode != displaySettings.windowMode) {
+        settingsDirty = true;
+    }
     displaySettings.windowMode = mode;
 }
 
@@ -150,19 +175,35 @@ void ConfigManager::SetResolutionIndex(int index) {
 }
 
 void ConfigManager::SetMasterVolume(int volume) {
-    audioSettings.masterVolume = std::clamp(volume, 0, 100);
+    volume = std::clamp(volume, 0, 100);
+    if (volume != audioSettings.masterVolume) {
+        settingsDirty = true;
+    }
+    audioSettings.masterVolume = volume;
 }
 
 void ConfigManager::SetMusicVolume(int volume) {
-    audioSettings.musicVolume = std::clamp(volume, 0, 100);
+    volume = std::clamp(volume, 0, 100);
+    if (volume != audioSettings.musicVolume) {
+        settingsDirty = true;
+    }
+    audioSettings.musicVolume = volume;
 }
 
 void ConfigManager::SetSFXVolume(int volume) {
-    audioSettings.sfxVolume = std::clamp(volume, 0, 100);
+    volume = std::clamp(volume, 0, 100);
+    if (volume != audioSettings.sfxVolume) {
+        settingsDirty = true;
+    }
+    audioSettings.sfxVolume = volume;
 }
 
 void ConfigManager::SetVoiceVolume(int volume) {
-    audioSettings.voiceVolume = std::clamp(volume, 0, 100);
+    volume = std::clamp(volume, 0, 100);
+    if (volume != audioSettings.voiceVolume) {
+        settingsDirty = true;
+    }
+    audioSettings.voiceVolume = volume;
 }
 
 void ConfigManager::ApplyAudioVolumes(bool audioInitialized) {
@@ -185,29 +226,29 @@ void ConfigManager::ApplyAudioVolumes(bool audioInitialized) {
 }
 
 void ConfigManager::CycleResolutionForward() {
-    displaySettings.selectedResolutionIndex = (displaySettings.selectedResolutionIndex + 1) % 3;
-    int width, height;
-    GetResolutionDimensions(displaySettings.selectedResolutionIndex, width, height);
-    SetWindowSize(width, height);
+    StepResolution(1);
 }
 
 void ConfigManager::CycleResolutionBackward() {
-    displaySettings.selectedResolutionIndex = (displaySettings.selectedResolutionIndex + 2) % 3;
-    int width, height;
-    GetResolutionDimensions(displaySettings.selectedResolutionIndex, width, height);
-    SetWindowSize(width, height);
+    StepResolution(-1);
+}
+
+void ConfigManager::StepResolution(int delta) {
+    // Wrap around the resolution table in either direction
+    int index = (displaySettings.selectedResolutionIndex + delta) % RESOLUTION_COUNT;
+    if (index < 0) {
+        index += RESOLUTION_COUNT;
+    }
+    SetResolutionIndex(index);
 }
 
 void ConfigManager::GetResolutionDimensions(int index, int& width, int& height) const {
-    const int resolutionWidths[] = {1280, 1600, 1920};
-    const int resolutionHeights[] = {720, 900, 1080};
-    
-    if (index >= 0 && index < 3) {
-        width = resolutionWidths[index];
-        height = resolutionHeights[index];
+    if (index >= 0 && index < RESOLUTION_COUNT) {
+        width = RESOLUTION_WIDTHS[index];
+        height = RESOLUTION_HEIGHTS[index];
     } else {
-        width = 1280;
-        height = 720;
+        width = RESOLUTION_WIDTHS[0];
+        height = RESOLUTION_HEIGHTS[0];
     }
 }
 
@@ -7,7 +7,8 @@ DialogueSystem::DialogueSystem(SDL_Renderer* renderer, TTF_Font* fontMedium,
     : renderer(renderer), fontMedium(fontMedium), fontSmall(fontSmall),
       textureManager(textureManager), currentLineIndex(0), isActive(false),
       waitingForInput(true), textRevealTimer(0.0f), revealedChars(0),
-      instantText(true), selectedChoice(0), showingChoices(false) {
+      instantText(true), lineSpriteLeft(nullptr), lineSpriteRight(nullptr),
+      linePortrait(nullptr), selectedChoice(0), showingChoices(false) {
 }
 
 void DialogueSystem::LoadDialogue(const std::vector<DialogueLine>& lines) {
@@ -27,6 +28,7 @@ void DialogueSystem::Start() {
     if (!dialogueLines.empty()) {
         displayedText = dialogueLines[0].text;
     }
+    PrepareCurrentLine();
     
     std::cout << "Dialogue started" << std::endl;
 }
@@ -79,11 +81,39 @@ void DialogueSystem::NextLine() {
         displayedText = dialogueLines[currentLineIndex].text;
         revealedChars = 0;
         textRevealTimer = 0.0f;
+        PrepareCurrentLine();
     } else {
         std::cout << "Dialogue complete" << std::endl;
     }
 }
 
+void DialogueSystem::PrepareCurrentLine() {
+    lineSpriteLeft = nullptr;
+    lineSpriteRight = nullptr;
+    linePortrait = nullptr;
+    lineWrappedText.clear();
+    
+    if (currentLineIndex >= (int)dialogueLines.size()) {
+        return;
+    }
+    
+    // Look textures up once per line instead of every frame. This also keeps a
+    // missing image from being retried (and logged) on every render.
+    const DialogueLine& line = dialogueLines[currentLineIndex];
+    if (!line.spriteLeft.empty()) {
+        lineSpriteLeft = textureManager->LoadTexture(line.spriteLeft);
+    }
+    if (!line.spriteRight.empty()) {
+        lineSpriteRight = textureManager->LoadTexture(line.spriteRight);
+    }
+    if (!line.portraitPath.empty()) {
+        linePortrait = textureManager->LoadTexture(line.portraitPath);
+    }
+    
+    // Word wrapping measures every word with TTF, so only do it when the line changes
+    lineWrappedText = WrapText(line.text, fontSmall, TEXT_MAX_WIDTH);
+}
+
 void DialogueSystem::Render() {
     if (!isActive || dialogueLines.empty() || currentLineIndex >= (int)dialogueLines.size()) {
         return;
@@ -93,7 +123,7 @@ void DialogueSystem::Render() {
     
     // Render sprites (left and right)
     if (!currentLine.spriteLeft.empty()) {
-        SDL_Texture* spriteLeft = textureManager->LoadTexture(currentLine.spriteLeft);
+        SDL_Texture* spriteLeft = lineSpriteLeft;
         if (spriteLeft) {
             // Get actual sprite dimensions
             int spriteWidth, spriteHeight;
@@ -106,7 +136,7 @@ void DialogueSystem::Render() {
     }
     
     if (!currentLine.spriteRight.empty()) {
-        SDL_Texture* spriteRight = textureManager->LoadTexture(currentLine.spriteRight);
+        SDL_Texture* spriteRight = lineSpriteRight;
         if (spriteRight) {
             // Get actual sprite dimensions
             int spriteWidth, spriteHeight;
@@ -129,7 +159,7 @@ void DialogueSystem::Render() {
     
     // Render portrait (if available)
     if (!currentLine.portraitPath.empty()) {
-        SDL_Texture* portrait = textureManager->LoadTexture(currentLine.portraitPath);
+        SDL_Texture* portrait = linePortrait;
         if (portrait) {
             textureManager->RenderTexture(portrait, 108, DIALOGUE_BOX_Y + 27, PORTRAIT_SIZE, PORTRAIT_SIZE);
         }
@@ -145,11 +175,9 @@ void DialogueSystem::Render() {
     // Render dialogue text (wrapped)
     int textX = currentLine.portraitPath.empty() ? 126 : 342;
     int textY = DIALOGUE_BOX_Y + (currentLine.speakerName.empty() ? 54 : 99);
-    int maxWidth = 1400;
     
-    std::vector<std::string> wrappedLines = WrapText(currentLine.text, fontSmall, maxWidth);
-    for (size_t i = 0; i < wrappedLines.size(); i++) {
-        RenderText(wrappedLines[i], textX, textY + (int)i * 45, fontSmall, 
+    for (size_t i = 0; i < lineWrappedText.size(); i++) {
+        RenderText(lineWrappedText[i], textX, textY + (int)i * 45, fontSmall, 
                    {255, 255, 255, 255}, false);
     }
     
@@ -119,6 +119,8 @@ void GameStateManager::LoadScene(const std::string& sceneId, SceneManager* scene
     if (sceneData.contains("background")) {
         std::string bgPath = "assets/" + sceneData["background"].get<std::string>();
         sceneManager->SetBackground(bgPath);
+    } else {
+        sceneManager->ClearBackground();
     }
 
     // Load scene music
@@ -144,13 +146,14 @@ void GameStateManager::EndScene(SceneManager* sceneManager, DialogueSystem* dial
     std::cout << "Scene complete" << std::endl;
 
     dialogueSystem->Stop();
-    sceneManager->ClearBackground();
 
-    // Load next scene or return to title
+    // Load next scene or return to title. The background is left in place for
+    // the next scene so SetBackground can keep it if the file is unchanged
     if (!currentSceneId.empty() && currentSceneId != "return_to_title") {
         LoadScene(currentSceneId, sceneManager, dialogueSystem);
     } else {
         std::cout << "Returning to title screen" << std::endl;
+        sceneManager->ClearBackground();
         currentState = GameState::STATE_TITLE;
         // Restart title music
         if (onLoadTitleMusic) {
@@ -2,19 +2,53 @@
 #include "ConfigManager.hpp"
 #include <iostream>
 #include <fstream>
+#include <algorithm>
 
 namespace Lehran {
 
 MapManager::MapManager(SDL_Renderer* renderer, TextureManager* textureManager, ConfigManager* configManager, TTF_Font* font)
     : renderer(renderer), textureManager(textureManager), configManager(configManager), font(font),
-      tileSize(32), mapWidth(0), mapHeight(0),
+      tileSize(32), mapWidth(0), mapHeight(0), unitDataLoaded(false),
       cameraX(0), cameraY(0), scale(3.0f), cursorX(0), cursorY(0),
       cursorTexture(nullptr), cursorSound(nullptr), showCursor(true),
       selectedUnitIndex(-1), moveRangeTexture(nullptr), attackRangeTexture(nullptr),
       showActionMenu(false), selectedActionIndex(0), originalUnitX(0), originalUnitY(0),
       showInventoryMenu(false), selectedInventoryIndex(0), inventoryUnitIndex(-1),
       showDropConfirmation(false), originalEquippedIndex(-1),
-      showUnitInfo(false), unitInfoIndex(-1) {
+      showUnitInfo(false), unitInfoIndex(-1), uiAssetsLoaded(false) {
+    // Cursor/range textures and the cursor sound are loaded by the first LoadMap
+}
+
+MapManager::~MapManager() {
+    ClearAtlas();
+    ClearMap();
+    ClearMenuLabels();
+    if (cursorSound) {
+        Mix_FreeChunk(cursorSound);
+        cursorSound = nullptr;
+    }
+}
+
+void MapManager::ClearAtlas() {
+    tileTypes.clear();
+    tileTexturesById.clear();
+    atlasPath.clear();
+}
+
+void MapManager::ClearMap() {
+    layers.clear();
+    units.clear();
+    mapName.clear();
+    mapWidth = 0;
+    mapHeight = 0;
+}
+
+void MapManager::LoadUIAssets() {
+    if (uiAssetsLoaded) {
+        return;
+    }
+    uiAssetsLoaded = true;
+    
     // Load cursor texture
     cursorTexture = textureManager->LoadTexture("assets/ui/cursor.png");
     if (!cursorTexture) {
@@ -39,26 +73,73 @@ MapManager::MapManager(SDL_Renderer* renderer, TextureManager* textureManager, C
     }
 }
 
-MapManager::~MapManager() {
-    ClearAtlas();
-    ClearMap();
-    if (cursorSound) {
-        Mix_FreeChunk(cursorSound);
-        cursorSound = nullptr;
+void MapManager::RenderMenuLabel(MenuLabel& label, const char* text, int x, int y) {
+    if (!label.texture) {
+        SDL_Color textColor = {255, 255, 255, 255};
+        SDL_Surface* surface = TTF_RenderText_Blended(font, text, textColor);
+        if (!surface) {
+            return;
+        }
+        label.texture = SDL_CreateTextureFromSurface(renderer, surface);
+        label.width = surface->w;
+        label.height = surface->h;
+        SDL_FreeSurface(surface);
+        if (!label.texture) {
+            return;
+        }
     }
+    
+    SDL_Rect textRect = {x, y, label.width, label.height};
+    SDL_RenderCopy(renderer, label.texture, nullptr, &textRect);
 }
 
-void MapManager::ClearAtlas() {
-    tileTypes.clear();
-    atlasPath.clear();
+void MapManager::ClearMenuLabels() {
+    for (MenuLabel* label : {&itemsLabel, &waitLabel, &dropLabel}) {
+        if (label->texture) {
+            SDL_DestroyTexture(label->texture);
+            label->texture = nullptr;
+        }
+    }
 }
 
-void MapManager::ClearMap() {
-    layers.clear();
-    units.clear();
-    mapName.clear();
-    mapWidth = 0;
-    mapHeight = 0;
+void MapManager::LoadUnitData() {
+    if (unitDataLoaded) {
+        return;
+    }
+    unitDataLoaded = true;
+    
+    // Load units.json, weapons.json, and classes.json for unit data
+    try {
+        std::ifstream unitsFile("data/units.json");
+        if (unitsFile.is_open()) {
+            unitsFile >> unitsData;
+            unitsFile.close();
+        }
+    } catch (const std::exception& e) {
+        std::cerr << "WARNING: Failed to load units.json: " << e.what() << std::endl;
+    }
+    
+    try {
+        std::ifstream weaponsFile("data/weapons.json");
+        if (weaponsFile.is_open()) {
+            json weaponsData;
+            weaponsFile >> weaponsData;
+            weaponsFile.close();
+            BuildWeaponIndex(weaponsData);
+        }
+    } catch (const std::exception& e) {
+        std::cerr << "WARNING: Failed to load weapons.json: " << e.what() << std::endl;
+    }
+    
+    try {
+        std::ifstream classesFile("data/classes.json");
+        if (classesFile.is_open()) {
+            classesFile >> classesData;
+            classesFile.close();
+        }
+    } catch (const std::exception& e) {
+        std::cerr << "WARNING: Failed to load classes.json: " << e.what() << std::endl;
+    }
 }
 
 bool MapManager::LoadAtlas(const std::string& atlasFile) {
@@ -98,8 +179,10 @@ bool MapManager::LoadAtlas(const std::string& atlasFile) {
                     std::cerr << "WARNING: Failed to load tile texture: " << tile.texturePath << std::endl;
                 }
                 
+                // First definition of an ID wins, same as the old linear search
+                tileTexturesById.emplace(tile.id, tile.texture);
                 tileTypes.push_back(tile);
-                std::cout << "  Loaded tile: " << tile.name << " (ID: " << tile.id << ")" << std::endl;
+                std::cout << "  Loaded tile: " << tile.name << " (ID: " << tile.id << ")" << '\n';
             }
         }
         
@@ -115,6 +198,7 @@ bool MapManager::LoadAtlas(const std::string& atlasFile) {
 bool MapManager::LoadMap(const std::string& mapFile) {
     std::cout << "Loading map: " << mapFile << std::endl;
     
+    LoadUIAssets();
     ClearMap();
     
     // Reset cursor and camera to starting position
@@ -134,6 +218,7 @@ bool MapManager::LoadMap(const std::string& mapFile) {
     showUnitInfo = false;
     unitInfoIndex = -1;
     moveRangeTiles.clear();
+    moveRangeGrid.clear();
     attackRangeTiles.clear();
     originalInventory.clear();
     originalEquippedIndex = -1;
@@ -166,56 +251,28 @@ bool MapManager::LoadMap(const std::string& mapFile) {
         
         // Load layers
         if (mapData.contains("layers")) {
+            layers.reserve(mapData["layers"].size());
             for (const auto& layerJson : mapData["layers"]) {
                 MapLayer layer;
                 layer.name = layerJson.value("name", "");
                 layer.visible = layerJson.value("visible", true);
                 
                 if (layerJson.contains("data") && layerJson["data"].is_array()) {
-                    for (const auto& tileId : layerJson["data"]) {
-                        layer.data.push_back(tileId);
-                    }
+                    // Convert the whole array in one go rather than appending tile by tile
+                    layer.data = layerJson["data"].get<std::vector<int>>();
                 }
                 
-                layers.push_back(layer);
-                std::cout << "  Loaded layer: " << layer.name << " (" << layer.data.size() << " tiles)" << std::endl;
+                std::cout << "  Loaded layer: " << layer.name << " (" << layer.data.size() << " tiles)" << '\n';
+                layers.push_back(std::move(layer));
             }
         }
         
         // Load units
         if (mapData.contains("units")) {
-            // Load units.json, weapons.json, and classes.json for unit data
-            json unitsData;
-            try {
-                std::ifstream unitsFile("data/units.json");
-                if (unitsFile.is_open()) {
-                    unitsFile >> unitsData;
-                    unitsFile.close();
-                }
-            } catch (const std::exception& e) {
-                std::cerr << "WARNING: Failed to load units.json: " << e.what() << std::endl;
-            }
-            
-            try {
-                std::ifstream weaponsFile("data/weapons.json");
-                if (weaponsFile.is_open()) {
-                    weaponsFile >> weaponsData;
-                    weaponsFile.close();
-                }
-            } catch (const std::exception& e) {
-                std::cerr << "WARNING: Failed to load weapons.json: " << e.what() << std::endl;
-            }
-            
-            try {
-                std::ifstream classesFile("data/classes.json");
-                if (classesFile.is_open()) {
-                    classesFile >> classesData;
-                    classesFile.close();
-                }
-            } catch (const std::exception& e) {
-                std::cerr << "WARNING: Failed to load classes.json: " << e.what() << std::endl;
-            }
+            // units.json, weapons.json and classes.json are shared by every map
+            LoadUnitData();
             
+            units.reserve(mapData["units"].size());
             for (const auto& unitJson : mapData["units"]) {
                 MapUnit unit;
                 unit.type = unitJson.value("type", "");
@@ -226,19 +283,23 @@ bool MapManager::LoadMap(const std::string& mapFile) {
                 
                 // Load unit data from units.json if unit_id is specified
                 // units.json is now organized as: { "player": { "alvis": {...} }, "enemy": {...} }
-                json unitData;
-                bool foundUnit = false;
-                if (!unit.unitId.empty() && unitsData.contains(unit.type)) {
-                    if (unitsData[unit.type].contains(unit.unitId)) {
-                        unitData = unitsData[unit.type][unit.unitId];
-                        foundUnit = true;
+                // Point into the cached units data instead of copying the unit's subtree
+                const json* foundUnit = nullptr;
+                if (!unit.unitId.empty()) {
+                    auto typeIt = unitsData.find(unit.type);
+                    if (typeIt != unitsData.end()) {
+                        auto unitIt = typeIt->find(unit.unitId);
+                        if (unitIt != typeIt->end()) {
+                            foundUnit = &*unitIt;
+                        }
                     }
                 }
                 
                 if (foundUnit) {
+                    const json& unitData = *foundUnit;
                     unit.name = unitData.value("name", "Unknown");
-                    std::string classId = unitData.value("class", "");
-                    unit.className = GetClassDisplayName(classId);
+                    unit.classId = unitData.value("class", "");
+                    unit.className = GetClassDisplayName(unit.classId);
                     unit.level = unitData.value("level", 1);
                     
                     if (unitData.contains("stats")) {
@@ -258,6 +319,7 @@ bool MapManager::LoadMap(const std::string& mapFile) {
                     
                     // Load inventory
                     if (unitData.contains("current_inventory") && unitData["current_inventory"].is_array()) {
+                        unit.inventory.reserve(unitData["current_inventory"].size());
                         for (const auto& itemId : unitData["current_inventory"]) {
                             unit.inventory.push_back(itemId.get<std::string>());
                         }
@@ -278,8 +340,8 @@ bool MapManager::LoadMap(const std::string& mapFile) {
                     std::cerr << "WARNING: Failed to load unit sprite: " << unit.spritePath << std::endl;
                 }
                 
-                units.push_back(unit);
-                std::cout << "  Loaded " << unit.type << " unit '" << unit.name << "' at (" << unit.x << ", " << unit.y << ")" << std::endl;
+                std::cout << "  Loaded " << unit.type << " unit '" << unit.name << "' at (" << unit.x << ", " << unit.y << ")" << '\n';
+                units.push_back(std::move(unit));
             }
         }
         
@@ -298,45 +360,47 @@ void MapManager::Render() {
     }
     
     int scaledTileSize = static_cast<int>(tileSize * scale);
+    if (scaledTileSize <= 0) {
+        return;
+    }
+    
+    // Only visit the tiles that overlap the screen (1920x1080) instead of
+    // walking the whole map and culling each tile
+    int firstX = cameraX > 0 ? cameraX / scaledTileSize : 0;
+    int firstY = cameraY > 0 ? cameraY / scaledTileSize : 0;
+    int lastX = std::min(mapWidth - 1, (cameraX + 1920 - 1) / scaledTileSize);
+    int lastY = std::min(mapHeight - 1, (cameraY + 1080 - 1) / scaledTileSize);
     
     // Render each layer
     for (const auto& layer : layers) {
         if (!layer.visible) continue;
         
         // Render tiles
-        for (int y = 0; y < mapHeight; y++) {
-            for (int x = 0; x < mapWidth; x++) {
+        for (int y = firstY; y <= lastY; y++) {
+            for (int x = firstX; x <= lastX; x++) {
                 int index = y * mapWidth + x;
-                if (index >= layer.data.size()) continue;
+                if (index >= (int)layer.data.size()) continue;
                 
                 int tileId = layer.data[index];
                 
-                // Find tile type
-                SDL_Texture* texture = nullptr;
-                for (const auto& tileType : tileTypes) {
-                    if (tileType.id == tileId) {
-                        texture = tileType.texture;
-                        break;
-                    }
-                }
-                
-                if (texture) {
+                // Find tile texture
+                auto tileIt = tileTexturesById.find(tileId);
+                if (tileIt != tileTexturesById.end() && tileIt->second) {
                     // Calculate screen position with scaling
                     int screenX = (x * scaledTileSize) - cameraX;
                     int screenY = (y * scaledTileSize) - cameraY;
-                    
-                    // Only render if on screen (1920x1080)
-                    if (screenX + scaledTileSize >= 0 && screenX < 1920 &&
-                        screenY + scaledTileSize >= 0 && screenY < 1080) {
-                        textureManager->RenderTexture(texture, screenX, screenY, scaledTileSize, scaledTileSize);
-                    }
+                    textureManager->RenderTexture(tileIt->second, screenX, screenY, scaledTileSize, scaledTileSize);
                 }
             }
         }
     }
     
+    // Ranges are kept while a moved unit picks an action (so a cancelled move can
+    // show them again), but only drawn before the move is made
+    bool showRanges = selectedUnitIndex >= 0 && !showActionMenu && !showInventoryMenu;
+    
     // Render movement range tiles
-    if (selectedUnitIndex >= 0 && moveRangeTexture && !showActionMenu) {
+    if (showRanges && moveRangeTexture) {
         for (const auto& tile : moveRangeTiles) {
             int screenX = (tile.first * scaledTileSize) - cameraX;
             int screenY = (tile.second * scaledTileSize) - cameraY;
@@ -349,7 +413,7 @@ void MapManager::Render() {
     }
     
     // Render attack range tiles
-    if (selectedUnitIndex >= 0 && attackRangeTexture && !showActionMenu) {
+    if (showRanges && attackRangeTexture) {
         for (const auto& tile : attackRangeTiles) {
             int screenX = (tile.first * scaledTileSize) - cameraX;
             int screenY = (tile.second * scaledTileSize) - cameraY;
@@ -409,29 +473,8 @@ void MapManager::Render() {
         SDL_RenderDrawRect(renderer, &waitBox);
         
         // Render text
-        SDL_Color textColor = {255, 255, 255, 255};
-        
-        SDL_Surface* inventorySurface = TTF_RenderText_Blended(font, "Items", textColor);
-        if (inventorySurface) {
-            SDL_Texture* inventoryTexture = SDL_CreateTextureFromSurface(renderer, inventorySurface);
-            if (inventoryTexture) {
-                SDL_Rect textRect = {inventoryBox.x + 10, inventoryBox.y + 8, inventorySurface->w, inventorySurface->h};
-                SDL_RenderCopy(renderer, inventoryTexture, nullptr, &textRect);
-                SDL_DestroyTexture(inventoryTexture);
-            }
-            SDL_FreeSurface(inventorySurface);
-        }
-        
-        SDL_Surface* waitSurface = TTF_RenderText_Blended(font, "Wait", textColor);
-        if (waitSurface) {
-            SDL_Texture* waitTexture = SDL_CreateTextureFromSurface(renderer, waitSurface);
-            if (waitTexture) {
-                SDL_Rect textRect = {waitBox.x + 10, waitBox.y + 8, waitSurface->w, waitSurface->h};
-                SDL_RenderCopy(renderer, waitTexture, nullptr, &textRect);
-                SDL_DestroyTexture(waitTexture);
-            }
-            SDL_FreeSurface(waitSurface);
-        }
+        RenderMenuLabel(itemsLabel, "Items", inventoryBox.x + 10, inventoryBox.y + 8);
+        RenderMenuLabel(waitLabel, "Wait", waitBox.x + 10, waitBox.y + 8);
     }
     
     // Render inventory menu if active
@@ -507,16 +550,7 @@ void MapManager::Render() {
         SDL_SetRenderDrawColor(renderer, 180, 180, 200, 255);
         SDL_RenderDrawRect(renderer, &dropBox);
         
-        SDL_Surface* dropSurface = TTF_RenderText_Blended(font, "Drop Item", textColor);
-        if (dropSurface) {
-            SDL_Texture* dropTexture = SDL_CreateTextureFromSurface(renderer, dropSurface);
-            if (dropTexture) {
-                SDL_Rect textRect = {dropBox.x + 10, dropBox.y + 5, dropSurface->w, dropSurface->h};
-                SDL_RenderCopy(renderer, dropTexture, nullptr, &textRect);
-                SDL_DestroyTexture(dropTexture);
-            }
-            SDL_FreeSurface(dropSurface);
-        }
+        RenderMenuLabel(dropLabel, "Drop Item", dropBox.x + 10, dropBox.y + 5);
         
         // Draw weapon info panel for selected item (if not on "Drop")
         if (selectedInventoryIndex < (int)unit.inventory.size()) {
@@ -775,6 +809,7 @@ void MapManager::SelectUnit() {
 void MapManager::CancelSelection() {
     selectedUnitIndex = -1;
     moveRangeTiles.clear();
+    moveRangeGrid.clear();
     attackRangeTiles.clear();
     showActionMenu = false;
     selectedActionIndex = 0;
@@ -782,7 +817,7 @@ void MapManager::CancelSelection() {
 }
 
 void MapManager::ConfirmMove() {
-    if (selectedUnitIndex < 0 || !IsInMoveRange(cursorX, cursorY)) {
+    if (selectedUnitIndex < 0 || showActionMenu || showInventoryMenu || !IsInMoveRange(cursorX, cursorY)) {
         return;
     }
     
@@ -794,11 +829,9 @@ void MapManager::ConfirmMove() {
     units[selectedUnitIndex].x = cursorX;
     units[selectedUnitIndex].y = cursorY;
     
-    // Clear movement ranges
-    moveRangeTiles.clear();
-    attackRangeTiles.clear();
-    
-    // Show action menu
+    // Show action menu. Movement ranges are kept (Render hides them while the
+    // action or inventory menu is open) so a cancelled move can show them again
+    // without recalculating
     showActionMenu = true;
     selectedActionIndex = 0;
     
@@ -807,27 +840,44 @@ void MapManager::ConfirmMove() {
 
 void MapManager::CalculateMovementRange() {
     moveRangeTiles.clear();
+    moveRangeGrid.clear();
     
     if (selectedUnitIndex < 0) return;
     
     const MapUnit& unit = units[selectedUnitIndex];
     int range = unit.mov;
     
+    moveRangeGrid.assign(mapWidth * mapHeight, false);
+    
+    // Unit index occupying each tile (first unit wins, as in GetUnitAtPosition),
+    // so the range check below doesn't scan every unit per tile
+    std::vector<int> occupant(mapWidth * mapHeight, -1);
+    for (size_t i = 0; i < units.size(); i++) {
+        const MapUnit& other = units[i];
+        if (other.x >= 0 && other.x < mapWidth && other.y >= 0 && other.y < mapHeight) {
+            int& tile = occupant[other.y * mapWidth + other.x];
+            if (tile < 0) {
+                tile = static_cast<int>(i);
+            }
+        }
+    }
+    
     // Simple flood fill for movement range (Manhattan distance)
     // Include current position (distance == 0) to allow staying in place
-    for (int y = 0; y < mapHeight; y++) {
-        for (int x = 0; x < mapWidth; x++) {
+    for (int y = std::max(0, unit.y - range); y <= std::min(mapHeight - 1, unit.y + range); y++) {
+        for (int x = std::max(0, unit.x - range); x <= std::min(mapWidth - 1, unit.x + range); x++) {
             int distance = abs(x - unit.x) + abs(y - unit.y);
             if (distance >= 0 && distance <= range) {
                 // Check if tile is passable and no other unit (or current position)
                 bool canMove = true;
-                int otherUnit = GetUnitAtPosition(x, y);
+                int otherUnit = occupant[y * mapWidth + x];
                 if (otherUnit >= 0 && otherUnit != selectedUnitIndex) {
                     canMove = false;
                 }
                 
                 if (canMove) {
                     moveRangeTiles.push_back({x, y});
+                    moveRangeGrid[y * mapWidth + x] = true;
                 }
             }
         }
@@ -845,34 +895,30 @@ void MapManager::CalculateAttackRange() {
     int moveRange = unit.mov;
     int attackRange = 2; // Default attack range
     
-    // Calculate attack range from edge of movement range (and current position)
-    for (int my = 0; my < mapHeight; my++) {
-        for (int mx = 0; mx < mapWidth; mx++) {
+    // Tiles already added, indexed by y * mapWidth + x
+    std::vector<bool> added(mapWidth * mapHeight, false);
+    
+    // Calculate attack range from edge of movement range (and current position).
+    // Loops are bounded to the diamond around the unit / move tile rather than the whole map.
+    for (int my = std::max(0, unit.y - moveRange); my <= std::min(mapHeight - 1, unit.y + moveRange); my++) {
+        for (int mx = std::max(0, unit.x - moveRange); mx <= std::min(mapWidth - 1, unit.x + moveRange); mx++) {
             int moveDist = abs(mx - unit.x) + abs(my - unit.y);
             
             // Skip if not within movement range (including current position)
             if (moveDist > moveRange) continue;
             
             // From this movement position, calculate attack range
-            for (int ay = 0; ay < mapHeight; ay++) {
-                for (int ax = 0; ax < mapWidth; ax++) {
+            for (int ay = std::max(0, my - attackRange); ay <= std::min(mapHeight - 1, my + attackRange); ay++) {
+                for (int ax = std::max(0, mx - attackRange); ax <= std::min(mapWidth - 1, mx + attackRange); ax++) {
                     int attackDist = abs(ax - mx) + abs(ay - my);
                     if (attackDist >= 1 && attackDist <= attackRange) {
                         // Check if this tile is in movement range (including current position)
                         int distFromUnit = abs(ax - unit.x) + abs(ay - unit.y);
                         bool inMoveRange = (distFromUnit >= 0 && distFromUnit <= moveRange);
-                        if (!inMoveRange) {
-                            // Check if already added
-                            bool alreadyAdded = false;
-                            for (const auto& tile : attackRangeTiles) {
-                                if (tile.first == ax && tile.second == ay) {
-                                    alreadyAdded = true;
-                                    break;
-                                }
-                            }
-                            if (!alreadyAdded) {
-                                attackRangeTiles.push_back({ax, ay});
-                            }
+                        int index = ay * mapWidth + ax;
+                        if (!inMoveRange && !added[index]) {
+                            added[index] = true;
+                            attackRangeTiles.push_back({ax, ay});
                         }
                     }
                 }
@@ -885,8 +931,9 @@ void MapManager::CalculateAttackRange() {
 
 bool MapManager::IsInMoveRange(int x, int y) const {
     // Check if it's in the movement range tiles
-    for (const auto& tile : moveRangeTiles) {
-        if (tile.first == x && tile.second == y) {
+    if (x >= 0 && x < mapWidth && y >= 0 && y < mapHeight) {
+        size_t index = static_cast<size_t>(y * mapWidth + x);
+        if (index < moveRangeGrid.size() && moveRangeGrid[index]) {
             return true;
         }
     }
@@ -919,6 +966,9 @@ void MapManager::ConfirmAction() {
         std::cout << "Unit waiting - inventory changes finalized" << std::endl;
         units[selectedUnitIndex].hasMoved = true;
         selectedUnitIndex = -1;
+        moveRangeTiles.clear();
+        moveRangeGrid.clear();
+        attackRangeTiles.clear();
         showActionMenu = false;
         
         // Clear inventory backup so changes are permanent
@@ -942,10 +992,6 @@ void MapManager::CancelActionMenu() {
     showActionMenu = false;
     selectedActionIndex = 0;
     
-    // Restore movement ranges
-    CalculateMovementRange();
-    CalculateAttackRange();
-    
     std::cout << "Cancelled action, unit returned to (" << originalUnitX << ", " << originalUnitY << ")" << std::endl;
 }
 
@@ -1060,91 +1106,56 @@ void MapManager::ConfirmInventoryAction() {
     }
 }
 
-WeaponData MapManager::GetWeaponData(const std::string& weaponId) const {
-    WeaponData weaponData;
-    weaponData.id = weaponId;
-    weaponData.name = weaponId;  // Default to ID if not found
+void MapManager::BuildWeaponIndex(const json& weaponsData) {
+    weaponsById.clear();
     
     // New structure: { "generic": { "sword": [...], "axe": [...] }, "prf": { "sword": [...] } }
-    // Search in generic weapons (organized by weapon type)
-    if (weaponsData.contains("generic") && weaponsData["generic"].is_object()) {
-        for (auto& [weaponType, weaponArray] : weaponsData["generic"].items()) {
-            if (weaponArray.is_array()) {
-                for (const auto& weapon : weaponArray) {
-                    if (weapon.value("id", "") == weaponId) {
-                        weaponData.name = weapon.value("name", weaponId);
-                        weaponData.type = weaponType; // Type is the key (sword, axe, anima, etc.)
-                        weaponData.might = weapon.value("might", 0);
-                        weaponData.hit = weapon.value("hit", 0);
-                        weaponData.crit = weapon.value("crit", 0);
-                        weaponData.weight = weapon.value("weight", 0);
-                        weaponData.durability = weapon.contains("durability") && weapon["durability"].is_null() ? -1 : weapon.value("durability", 0);
-                        if (weapon.contains("range") && weapon["range"].is_array()) {
-                            for (const auto& r : weapon["range"]) {
-                                weaponData.range.push_back(r.get<int>());
-                            }
-                        }
-                        weaponData.isPRF = false;
-                        return weaponData;
+    // Categories are indexed in lookup order; the first definition of an ID wins
+    for (const char* category : {"generic", "prf", "attributed"}) {
+        auto categoryIt = weaponsData.find(category);
+        if (categoryIt == weaponsData.end() || !categoryIt->is_object()) continue;
+        
+        bool isPRF = std::string(category) == "prf";
+        for (auto& [weaponType, weaponArray] : categoryIt->items()) {
+            if (!weaponArray.is_array()) continue;
+            
+            for (const auto& weapon : weaponArray) {
+                std::string weaponId = weapon.value("id", "");
+                if (weaponId.empty() || weaponsById.count(weaponId)) continue;
+                
+                WeaponData weaponData;
+                weaponData.id = weaponId;
+                weaponData.name = weapon.value("name", weaponId);
+                weaponData.type = weaponType; // Type is the key (sword, axe, anima, etc.)
+                weaponData.might = weapon.value("might", 0);
+                weaponData.hit = weapon.value("hit", 0);
+                weaponData.crit = weapon.value("crit", 0);
+                weaponData.weight = weapon.value("weight", 0);
+                weaponData.durability = weapon.contains("durability") && weapon["durability"].is_null() ? -1 : weapon.value("durability", 0);
+                if (weapon.contains("range") && weapon["range"].is_array()) {
+                    for (const auto& r : weapon["range"]) {
+                        weaponData.range.push_back(r.get<int>());
                     }
                 }
-            }
-        }
-    }
-    
-    // Search in PRF weapons (organized by weapon type)
-    if (weaponsData.contains("prf") && weaponsData["prf"].is_object()) {
-        for (auto& [weaponType, weaponArray] : weaponsData["prf"].items()) {
-            if (weaponArray.is_array()) {
-                for (const auto& weapon : weaponArray) {
-                    if (weapon.value("id", "") == weaponId) {
-                        weaponData.name = weapon.value("name", weaponId);
-                        weaponData.type = weaponType; // Type is the key (sword, dark, stone, etc.)
-                        weaponData.might = weapon.value("might", 0);
-                        weaponData.hit = weapon.value("hit", 0);
-                        weaponData.crit = weapon.value("crit", 0);
-                        weaponData.weight = weapon.value("weight", 0);
-                        weaponData.durability = weapon.contains("durability") && weapon["durability"].is_null() ? -1 : weapon.value("durability", 0);
-                        if (weapon.contains("range") && weapon["range"].is_array()) {
-                            for (const auto& r : weapon["range"]) {
-                                weaponData.range.push_back(r.get<int>());
-                            }
-                        }
-                        weaponData.user = weapon.value("user", "");
-                        weaponData.isPRF = true;
-                        return weaponData;
-                    }
+                if (isPRF) {
+                    weaponData.user = weapon.value("user", "");
                 }
+                weaponData.isPRF = isPRF;
+                weaponsById.emplace(weaponId, std::move(weaponData));
             }
         }
     }
-    
-    // Search in attributed weapons (if exists - organized by weapon type)
-    if (weaponsData.contains("attributed") && weaponsData["attributed"].is_object()) {
-        for (auto& [weaponType, weaponArray] : weaponsData["attributed"].items()) {
-            if (weaponArray.is_array()) {
-                for (const auto& weapon : weaponArray) {
-                    if (weapon.value("id", "") == weaponId) {
-                        weaponData.name = weapon.value("name", weaponId);
-                        weaponData.type = weaponType;
-                        weaponData.might = weapon.value("might", 0);
-                        weaponData.hit = weapon.value("hit", 0);
-                        weaponData.crit = weapon.value("crit", 0);
-                        weaponData.weight = weapon.value("weight", 0);
-                        weaponData.durability = weapon.contains("durability") && weapon["durability"].is_null() ? -1 : weapon.value("durability", 0);
-                        if (weapon.contains("range") && weapon["range"].is_array()) {
-                            for (const auto& r : weapon["range"]) {
-                                weaponData.range.push_back(r.get<int>());
-                            }
-                        }
-                        weaponData.isPRF = false;
-                        return weaponData;
-                    }
-                }
-            }
-        }
+}
+
+WeaponData MapManager::GetWeaponData(const std::string& weaponId) const {
+    auto it = weaponsById.find(weaponId);
+    if (it != weaponsById.end()) {
+        return it->second;
     }
     
+    WeaponData weaponData;
+    weaponData.id = weaponId;
+    weaponData.name = weaponId;  // Default to ID if not found
     return weaponData;
 }
 
@@ -1154,20 +1165,17 @@ bool MapManager::CanUnitWieldWeapon(const MapUnit& unit, const WeaponData& weapo
         return weapon.user == unit.unitId;
     }
     
-    // Need to search by display name or store the class ID separately
-    // For now, search through all classes to find one with matching display name
-    for (auto& [classId, classArray] : classesData.items()) {
-        if (classArray.is_array() && !classArray.empty()) {
-            std::string displayName = classArray[0].value("name", "");
-            if (displayName == unit.className && classArray[0].contains("weapon_types")) {
-                const auto& weaponTypes = classArray[0]["weapon_types"];
-                if (weaponTypes.is_array()) {
-                    for (const auto& wType : weaponTypes) {
-                        if (wType.get<std::string>() == weapon.type) {
-                            return true;
-                        }
-                    }
-                }
+    // Look up the unit's class directly by ID
+    auto classIt = classesData.find(unit.classId);
+    if (classIt == classesData.end() || !classIt->is_array() || classIt->empty()) {
+        return false;
+    }
+    
+    const auto& classInfo = (*classIt)[0];
+    if (classInfo.contains("weapon_types") && classInfo["weapon_types"].is_array()) {
+        for (const auto& wType : classInfo["weapon_types"]) {
+            if (wType.get<std::string>() == weapon.type) {
+                return true;
             }
         }
     }
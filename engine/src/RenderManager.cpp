@@ -4,12 +4,24 @@
 
 namespace Lehran {
 
+// Menu and settings labels, shared across frames
+const int TITLE_MENU_COUNT = 6;
+const char* const TITLE_MENU_ITEMS[TITLE_MENU_COUNT] = {"New Game", "Load Game", "Settings", "Map Test", "VN Test", "Exit"};
+const char* const RESOLUTION_LABELS[] = {"1280x720 (720p)", "1600x900", "1920x1080 (1080p)"};
+const char* const WINDOW_MODE_LABELS[] = {"Windowed", "Borderless", "Fullscreen"};
+
 RenderManager::RenderManager(SDL_Renderer* renderer, TTF_Font* fontLarge, 
                              TTF_Font* fontMedium, TTF_Font* fontSmall)
-    : renderer(renderer), fontLarge(fontLarge), fontMedium(fontMedium), fontSmall(fontSmall) {
+    : renderer(renderer), fontLarge(fontLarge), fontMedium(fontMedium), fontSmall(fontSmall),
+      gradientTexture(nullptr) {
 }
 
 RenderManager::~RenderManager() {
+    ClearTextCache();
+    if (gradientTexture) {
+        SDL_DestroyTexture(gradientTexture);
+        gradientTexture = nullptr;
+    }
 }
 
 void RenderManager::RenderSplash(float splashTimer) {
@@ -43,8 +55,7 @@ void RenderManager::RenderTitle(const std::string& gameName, int selectedMenuIte
     RenderText(gameName.c_str(), SCREEN_WIDTH / 2, 270, fontLarge, {255, 255, 255, 255});
 
     // Menu items
-    const char* menuItems[] = {"New Game", "Load Game", "Settings", "Map Test", "VN Test", "Exit"};
-    for (int i = 0; i < 6; i++) {
+    for (int i = 0; i < TITLE_MENU_COUNT; i++) {
         SDL_Color color = (i == selectedMenuItem) ? SDL_Color{255, 255, 100, 255} : SDL_Color{200, 200, 200, 255};
 
         // Draw arrow for selected item
@@ -52,7 +63,7 @@ void RenderManager::RenderTitle(const std::string& gameName, int selectedMenuIte
             RenderText(">", SCREEN_WIDTH / 2 - 200, 540 + i * 90, fontMedium, {255, 255, 100, 255});
         }
 
-        RenderText(menuItems[i], SCREEN_WIDTH / 2, 540 + i * 90, fontMedium, color);
+        RenderText(TITLE_MENU_ITEMS[i], SCREEN_WIDTH / 2, 540 + i * 90, fontMedium, color);
     }
 
     // Version info
@@ -79,10 +90,6 @@ void RenderManager::RenderSettings(const ConfigManager& config, int selectedSett
     // Title
     RenderText("Settings", SCREEN_WIDTH / 2, 200, fontLarge, {255, 255, 255, 255});
 
-    // Resolution options
-    const char* resolutions[] = {"1280x720 (720p)", "1600x900", "1920x1080 (1080p)"};
-    const char* windowModes[] = {"Windowed", "Borderless", "Fullscreen"};
-
     // Menu items with values
     int yStart = 350 - settingsScrollOffset;
     int spacing = 100;
@@ -106,7 +113,7 @@ void RenderManager::RenderSettings(const ConfigManager& config, int selectedSett
         RenderText("<", SCREEN_WIDTH / 2 + 50, yStart, fontMedium, {255, 255, 100, 255});
         RenderText(">", SCREEN_WIDTH / 2 + 380, yStart, fontMedium, {255, 255, 100, 255});
     }
-    RenderText(windowModes[static_cast<int>(config.GetWindowMode())], SCREEN_WIDTH / 2 + 215, yStart, fontMedium, color0);
+    RenderText(WINDOW_MODE_LABELS[static_cast<int>(config.GetWindowMode())], SCREEN_WIDTH / 2 + 215, yStart, fontMedium, color0);
 
     // Resolution selection
     SDL_Color color1 = (selectedSettingsItem == 1) ? SDL_Color{255, 255, 100, 255} : SDL_Color{200, 200, 200, 255};
@@ -123,7 +130,7 @@ void RenderManager::RenderSettings(const ConfigManager& config, int selectedSett
 
     // Show current resolution or note for fullscreen
     if (config.GetWindowMode() == WindowMode::WINDOWED) {
-        RenderText(resolutions[config.GetResolutionIndex()], SCREEN_WIDTH / 2 + 250, yStart + spacing, fontMedium, color1);
+        RenderText(RESOLUTION_LABELS[config.GetResolutionIndex()], SCREEN_WIDTH / 2 + 250, yStart + spacing, fontMedium, color1);
     } else {
         RenderText("(Uses native resolution)", SCREEN_WIDTH / 2 + 250, yStart + spacing, fontSmall, {150, 150, 150, 255});
     }
@@ -226,8 +233,7 @@ void RenderManager::RenderSettings(const ConfigManager& config, int selectedSett
                SCREEN_WIDTH / 2, SCREEN_HEIGHT - 80, fontSmall, {150, 150, 150, 255});
 
     // Current window info
-    const char* modeStr = (config.GetWindowMode() == WindowMode::WINDOWED) ? "Windowed" :
-                          (config.GetWindowMode() == WindowMode::BORDERLESS) ? "Borderless" : "Fullscreen";
+    const char* modeStr = WINDOW_MODE_LABELS[static_cast<int>(config.GetWindowMode())];
     char windowInfo[128];
     if (config.GetWindowMode() == WindowMode::WINDOWED) {
         snprintf(windowInfo, sizeof(windowInfo), "Current: %dx%d (%s)", 
@@ -242,36 +248,56 @@ void RenderManager::RenderSettings(const ConfigManager& config, int selectedSett
 void RenderManager::RenderText(const char* text, int x, int y, TTF_Font* font, SDL_Color color, bool alignRight) {
     if (!font || !text) return;
 
-    SDL_Surface* surface = TTF_RenderText_Blended(font, text, color);
-    if (!surface) return;
+    // Menu labels are the same every frame, so reuse their textures instead of
+    // re-rasterizing them. Alpha is left out of the key so fades share one texture.
+    char prefix[48];
+    snprintf(prefix, sizeof(prefix), "%p|%02x%02x%02x|", (void*)font, color.r, color.g, color.b);
+    std::string key = prefix;
+    key += text;
+
+    auto it = textCache.find(key);
+    if (it == textCache.end()) {
+        // Dynamic strings (volume values, window info) keep adding entries; start over if it gets large
+        if (textCache.size() >= 256) {
+            ClearTextCache();
+        }
+
+        SDL_Surface* surface = TTF_RenderText_Blended(font, text, {color.r, color.g, color.b, 255});
+        if (!surface) return;
 
-    SDL_Texture* texture = SDL_CreateTextureFromSurface(renderer, surface);
-    if (!texture) {
+        SDL_Texture* texture = SDL_CreateTextureFromSurface(renderer, surface);
+        CachedText cached = {texture, surface->w, surface->h};
         SDL_FreeSurface(surface);
-        return;
-    }
+        if (!texture) return;
 
-    // Set texture alpha if color has alpha component
-    if (color.a < 255) {
-        SDL_SetTextureAlphaMod(texture, color.a);
+        it = textCache.emplace(key, cached).first;
     }
 
+    const CachedText& cached = it->second;
+
+    // Set texture alpha (reset to opaque for cached textures that were faded before)
+    SDL_SetTextureAlphaMod(cached.texture, color.a);
+
     SDL_Rect destRect;
-    destRect.w = surface->w;
-    destRect.h = surface->h;
+    destRect.w = cached.width;
+    destRect.h = cached.height;
 
     if (alignRight) {
-        destRect.x = x - surface->w;
-        destRect.y = y - surface->h;
+        destRect.x = x - cached.width;
+        destRect.y = y - cached.height;
     } else {
-        destRect.x = x - surface->w / 2;
-        destRect.y = y - surface->h / 2;
+        destRect.x = x - cached.width / 2;
+        destRect.y = y - cached.height / 2;
     }
 
-    SDL_RenderCopy(renderer, texture, nullptr, &destRect);
+    SDL_RenderCopy(renderer, cached.texture, nullptr, &destRect);
+}
 
-    SDL_DestroyTexture(texture);
-    SDL_FreeSurface(surface);
+void RenderManager::ClearTextCache() {
+    for (auto& entry : textCache) {
+        SDL_DestroyTexture(entry.second.texture);
+    }
+    textCache.clear();
 }
 
 void RenderManager::RenderText(const std::string& text, int x, int y, TTF_Font* font, SDL_Color color, bool alignRight) {
@@ -279,7 +305,27 @@ void RenderManager::RenderText(const std::string& text, int x, int y, TTF_Font*
 }
 
 void RenderManager::RenderGradientBackground() {
-    // Gradient background (simplified)
+    // The gradient only varies per row, so build it once as a 1px-wide strip and stretch it
+    if (!gradientTexture) {
+        SDL_Surface* strip = SDL_CreateRGBSurfaceWithFormat(0, 1, SCREEN_HEIGHT, 32, SDL_PIXELFORMAT_RGBA32);
+        if (strip) {
+            for (int y = 0; y < SCREEN_HEIGHT; y++) {
+                int colorValue = 20 + (y * 40 / SCREEN_HEIGHT);
+                SDL_Rect row = {0, y, 1, 1};
+                SDL_FillRect(strip, &row, SDL_MapRGBA(strip->format, colorValue, colorValue, colorValue + 20, 255));
+            }
+            gradientTexture = SDL_CreateTextureFromSurface(renderer, strip);
+            SDL_FreeSurface(strip);
+        }
+    }
+
+    if (gradientTexture) {
+        SDL_Rect fullScreen = {0, 0, SCREEN_WIDTH, SCREEN_HEIGHT};
+        SDL_RenderCopy(renderer, gradientTexture, nullptr, &fullScreen);
+        return;
+    }
+
+    // Fallback: draw the gradient line by line
     for (int y = 0; y < SCREEN_HEIGHT; y++) {
         int colorValue = 20 + (y * 40 / SCREEN_HEIGHT);
         SDL_SetRenderDrawColor(renderer, colorValue, colorValue, colorValue + 20, 255);
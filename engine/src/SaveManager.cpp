@@ -242,9 +242,18 @@ bool SaveManager::save(const SaveData& data, int slot_number, bool use_json) {
     
     std::string path = get_slot_path(slot_number, use_json);
     
-    // Create backup of existing save
+    // Move the existing save aside as the backup. It is about to be
+    // overwritten anyway, so a rename avoids copying the file's contents.
+    std::string backup_path = get_backup_path(slot_number) + (use_json ? ".json" : ".sav");
+    bool moved_to_backup = false;
     if (fs::exists(path)) {
-        backup_slot(slot_number);
+        std::error_code ec;
+        fs::rename(path, backup_path, ec);
+        if (ec) {
+            backup_slot(slot_number);
+        } else {
+            moved_to_backup = true;
+        }
     }
     
     // Save in appropriate format
@@ -254,6 +263,15 @@ bool SaveManager::save(const SaveData& data, int slot_number, bool use_json) {
         std::cout << "Save successful: " << path << std::endl;
     } else {
         std::cerr << "Save failed: " << path << std::endl;
+        
+        // Put the previous save back so the slot isn't left empty or truncated
+        if (moved_to_backup) {
+            std::error_code ec;
+            fs::rename(backup_path, path, ec);
+            if (ec) {
+                std::cerr << "Failed to restore previous save: " << ec.message() << std::endl;
+            }
+        }
     }
     
     return success;
@@ -292,6 +310,21 @@ bool SaveManager::get_slot_info(int slot_number, std::string& slot_name, time_t&
     return true;
 }
 
+bool SaveManager::get_slot_file_stamp(int slot_number, fs::file_time_type& write_time, std::uintmax_t& file_size) const {
+    // Same lookup order as load(): JSON first, then binary
+    for (bool use_json : {true, false}) {
+        std::string path = get_slot_path(slot_number, use_json);
+        std::error_code ec;
+        write_time = fs::last_write_time(path, ec);
+        if (ec) {
+            continue;
+        }
+        file_size = fs::file_size(path, ec);
+        return !ec;
+    }
+    return false;
+}
+
 bool SaveManager::delete_slot(int slot_number) {
     bool deleted = false;
     
@@ -448,7 +481,13 @@ bool SaveManager::load_json(const std::string& path, SaveData& data) {
 
 bool SaveManager::save_binary(const SaveData& data, const std::string& path) {
     try {
+        // Serialize data to JSON first, then convert to binary
+        json j = data.to_json();
+        std::string json_str = j.dump();
+        
+        // Size the buffer up front: magic, version, length prefix, payload, checksum
         std::vector<uint8_t> buffer;
+        buffer.reserve(json_str.size() + 4 * sizeof(uint32_t));
         
         // Write magic number
         write_uint32(buffer, MAGIC_NUMBER);
@@ -456,10 +495,6 @@ bool SaveManager::save_binary(const SaveData& data, const std::string& path) {
         // Write version
         write_uint32(buffer, SAVE_VERSION);
         
-        // Serialize data to JSON first, then convert to binary
-        json j = data.to_json();
-        std::string json_str = j.dump();
-        
         // Write data
         write_string(buffer, json_str);
         
@@ -518,15 +553,17 @@ bool SaveManager::load_binary(const std::string& path, SaveData& data) {
             return false;
         }
         
-        // Read data
-        std::string json_str = read_string(buffer.data(), offset);
+        // Read data (parsed in place below instead of copying it into a string)
+        uint32_t json_length = read_uint32(buffer.data(), offset);
+        const uint8_t* json_begin = buffer.data() + offset;
+        offset += json_length;
         
         // Verify checksum
         uint32_t stored_checksum = read_uint32(buffer.data(), offset);
         // Note: In full implementation, recalculate and verify checksum
         
         // Parse JSON
-        json j = json::parse(json_str);
+        json j = json::parse(json_begin, json_begin + json_length);
         data.from_json(j);
         
         return true;
@@ -644,8 +681,10 @@ void SaveManager::ensure_save_directory() {
 }
 
 bool SaveManager::detect_format(const std::string& path) {
-    // Check file extension
-    if (path.size() >= 5 && path.substr(path.size() - 5) == ".json") {
+    // Check file extension (compare in place, no substring copy)
+    static const std::string json_ext = ".json";
+    if (path.size() >= json_ext.size() &&
+        path.compare(path.size() - json_ext.size(), json_ext.size(), json_ext) == 0) {
         return true; // JSON
     }
     return false; // Binary
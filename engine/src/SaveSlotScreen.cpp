@@ -1,14 +1,14 @@
 #include "SaveSlotScreen.hpp"
-#include <sstream>
-#include <iomanip>
+#include <chrono>
+#include <cstdio>
 #include <iostream>
 
 SaveSlotScreen::SaveSlotScreen(SDL_Renderer* renderer, TTF_Font* fontLarge, 
                                TTF_Font* fontMedium, TTF_Font* fontSmall,
                                Lehran::SaveManager* saveManager)
     : renderer(renderer), fontLarge(fontLarge), fontMedium(fontMedium),
-      fontSmall(fontSmall), saveManager(saveManager),
-      currentMode(Mode::NEW_GAME), selectedSlot(0), 
+      fontSmall(fontSmall), saveManager(saveManager), backgroundTexture(nullptr),
+      currentMode(Mode::NEW_GAME), selectedSlot(0), slotInfoLoaded(false),
       shouldReturn(false), selectedSlotToStart(-1),
       showingConfirmation(false), confirmationChoice(1),
       slotToModify(-1), targetSlot(-1) {
@@ -16,9 +16,16 @@ SaveSlotScreen::SaveSlotScreen(SDL_Renderer* renderer, TTF_Font* fontLarge,
     LoadSlotInfo();
 }
 
+SaveSlotScreen::~SaveSlotScreen() {
+    if (backgroundTexture) {
+        SDL_DestroyTexture(backgroundTexture);
+        backgroundTexture = nullptr;
+    }
+}
+
 void SaveSlotScreen::SetMode(Mode mode) {
+    // Slot info doesn't depend on the mode; Reset() rescans when the screen is entered
     currentMode = mode;
-    LoadSlotInfo();
 }
 
 void SaveSlotScreen::Reset() {
@@ -34,8 +41,25 @@ void SaveSlotScreen::Reset() {
 
 void SaveSlotScreen::LoadSlotInfo() {
     for (int i = 0; i < 5; i++) {
+        // Only re-read slots whose save file appeared, vanished or changed since the last scan
+        std::filesystem::file_time_type writeTime;
+        std::uintmax_t fileSize = 0;
+        bool hasFile = saveManager->get_slot_file_stamp(i, writeTime, fileSize);
+        if (slotInfoLoaded && hasFile == slots[i].hasFile &&
+            (!hasFile || (!slots[i].writeTimeRecent && writeTime == slots[i].writeTime &&
+                          fileSize == slots[i].fileSize))) {
+            continue;
+        }
+        
         slots[i].slotNumber = i;
         slots[i].hasData = false;
+        slots[i].hasFile = hasFile;
+        slots[i].writeTime = writeTime;
+        slots[i].fileSize = fileSize;
+        // Some filesystems store mtimes in 1-2 second steps (FAT/exFAT, HFS+), so
+        // a file written just before this scan is re-read next time regardless
+        slots[i].writeTimeRecent = hasFile &&
+            writeTime > std::filesystem::file_time_type::clock::now() - std::chrono::seconds(2);
         
         Lehran::SaveData data;
         if (saveManager->load(i, data) && !data.slot_name.empty()) {
@@ -47,13 +71,19 @@ void SaveSlotScreen::LoadSlotInfo() {
             strftime(timeStr, sizeof(timeStr), "%Y-%m-%d %H:%M", localtime(&data.timestamp));
             slots[i].timestamp = timeStr;
             slots[i].playtime = data.turn_count; // Using turn_count as a proxy for playtime for now
+            slots[i].chapterText = (slots[i].chapter == 0) ? "Prologue" : "Chapter " + std::to_string(slots[i].chapter);
+            slots[i].playtimeText = FormatPlaytime(slots[i].playtime);
         } else {
             slots[i].characterName = "Empty";
             slots[i].chapter = 0;
             slots[i].timestamp = "";
             slots[i].playtime = 0;
+            slots[i].chapterText.clear();
+            slots[i].playtimeText.clear();
         }
     }
+    
+    slotInfoLoaded = true;
 }
 
 void SaveSlotScreen::HandleInput(SDL_Keycode key) {
@@ -141,11 +171,29 @@ void SaveSlotScreen::HandleInput(SDL_Keycode key) {
 }
 
 void SaveSlotScreen::Render() {
-    // Dark blue gradient background
-    for (int y = 0; y < 1080; y++) {
-        int colorValue = 10 + (y * 30 / 1080);
-        SDL_SetRenderDrawColor(renderer, colorValue, colorValue, colorValue + 10, 255);
-        SDL_RenderDrawLine(renderer, 0, y, 1920, y);
+    // Dark blue gradient background (varies per row only - built once as a 1px strip)
+    if (!backgroundTexture) {
+        SDL_Surface* strip = SDL_CreateRGBSurfaceWithFormat(0, 1, 1080, 32, SDL_PIXELFORMAT_RGBA32);
+        if (strip) {
+            for (int y = 0; y < 1080; y++) {
+                int colorValue = 10 + (y * 30 / 1080);
+                SDL_Rect row = {0, y, 1, 1};
+                SDL_FillRect(strip, &row, SDL_MapRGBA(strip->format, colorValue, colorValue, colorValue + 10, 255));
+            }
+            backgroundTexture = SDL_CreateTextureFromSurface(renderer, strip);
+            SDL_FreeSurface(strip);
+        }
+    }
+    
+    if (backgroundTexture) {
+        SDL_Rect fullScreen = {0, 0, 1920, 1080};
+        SDL_RenderCopy(renderer, backgroundTexture, nullptr, &fullScreen);
+    } else {
+        for (int y = 0; y < 1080; y++) {
+            int colorValue = 10 + (y * 30 / 1080);
+            SDL_SetRenderDrawColor(renderer, colorValue, colorValue, colorValue + 10, 255);
+            SDL_RenderDrawLine(renderer, 0, y, 1920, y);
+        }
     }
     
     // Title based on mode
@@ -202,12 +250,10 @@ void SaveSlotScreen::Render() {
             RenderText(slots[i].characterName, 140, yPos + 15, fontSmall, {255, 255, 255, 255}, false);
             
             // Chapter
-            std::string chapterText = (slots[i].chapter == 0) ? "Prologue" : "Chapter " + std::to_string(slots[i].chapter);
-            RenderText(chapterText, 400, yPos, fontSmall, {200, 200, 200, 255}, false);
+            RenderText(slots[i].chapterText, 400, yPos, fontSmall, {200, 200, 200, 255}, false);
             
             // Playtime
-            std::string playtimeText = FormatPlaytime(slots[i].playtime);
-            RenderText(playtimeText, 1440, yPos, fontSmall, {200, 200, 200, 255}, false);
+            RenderText(slots[i].playtimeText, 1440, yPos, fontSmall, {200, 200, 200, 255}, false);
         } else {
             // Empty slot
             SDL_Color emptyColor;
@@ -314,8 +360,7 @@ std::string SaveSlotScreen::FormatPlaytime(int seconds) {
     int hours = seconds / 3600;
     int minutes = (seconds % 3600) / 60;
     
-    std::ostringstream oss;
-    oss << std::setfill('0') << std::setw(2) << hours << ":" 
-        << std::setfill('0') << std::setw(2) << minutes;
-    return oss.str();
+    char buffer[16];
+    snprintf(buffer, sizeof(buffer), "%02d:%02d", hours, minutes);
+    return buffer;
 }
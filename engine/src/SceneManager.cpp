@@ -12,6 +12,11 @@ SceneManager::~SceneManager() {
 }
 
 void SceneManager::SetBackground(const std::string& filePath) {
+    // Nothing to do if the previous scene already showed this background
+    if (backgroundTexture && filePath == currentBackground) {
+        return;
+    }
+    
     currentBackground = filePath;
     backgroundTexture = textureManager->LoadTexture(filePath);
     
@@ -1,8 +1,15 @@
 #include "TextureManager.hpp"
 #include <iostream>
+#include <algorithm>
 
 TextureManager::TextureManager(SDL_Renderer* renderer) 
-    : renderer(renderer) {
+    : renderer(renderer), maxTextureWidth(0), maxTextureHeight(0) {
+    // Query texture size limits once so oversized images can be scaled before upload
+    SDL_RendererInfo info;
+    if (renderer && SDL_GetRendererInfo(renderer, &info) == 0) {
+        maxTextureWidth = info.max_texture_width;
+        maxTextureHeight = info.max_texture_height;
+    }
 }
 
 TextureManager::~TextureManager() {
@@ -23,6 +30,28 @@ SDL_Texture* TextureManager::LoadTexture(const std::string& filePath) {
         return nullptr;
     }
     
+    // Downscale images larger than the renderer can hold instead of failing the upload
+    if (maxTextureWidth > 0 && maxTextureHeight > 0 &&
+        (surface->w > maxTextureWidth || surface->h > maxTextureHeight)) {
+        float fit = std::min((float)maxTextureWidth / surface->w, (float)maxTextureHeight / surface->h);
+        int scaledWidth = std::max(1, (int)(surface->w * fit));
+        int scaledHeight = std::max(1, (int)(surface->h * fit));
+        
+        SDL_Surface* scaled = SDL_CreateRGBSurfaceWithFormat(0, scaledWidth, scaledHeight, 32, SDL_PIXELFORMAT_RGBA32);
+        if (scaled) {
+            // Copy alpha as-is rather than blending onto the empty surface
+            SDL_SetSurfaceBlendMode(surface, SDL_BLENDMODE_NONE);
+            if (SDL_BlitScaled(surface, nullptr, scaled, nullptr) == 0) {
+                std::cout << "Downscaled " << filePath << " from " << surface->w << "x" << surface->h
+                          << " to " << scaledWidth << "x" << scaledHeight << std::endl;
+                SDL_FreeSurface(surface);
+                surface = scaled;
+            } else {
+                SDL_FreeSurface(scaled);
+            }
+        }
+    }
+    
     // Create texture from surface
     SDL_Texture* texture = SDL_CreateTextureFromSurface(renderer, surface);
     SDL_FreeSurface(surface);